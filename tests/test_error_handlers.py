@@ -3,26 +3,13 @@ Test cases for Error Handlers
 """
 
 
-import unittest
+import pytest
 from service.common.error_handlers import bad_request, not_found, method_not_supported
 
 
-class TestErrorHandlers(unittest.TestCase):
-    """Error Handlers testcase """
-    def test_bad_request(self):
-        """ bad request test """
-        bad_errror = bad_request("error")
+@pytest.mark.parametrize("handler", [bad_request, not_found, method_not_supported])
+def test_handler_returns_tuple(handler):
+    """ error handlers return a (response, status) tuple """
+    response = handler("error")
 
-        self.assertIsInstance(bad_errror, tuple)
-
-    def test_not_found(self):
-        """ not_found test """
-        bad_errror = not_found("error")
-
-        self.assertIsInstance(bad_errror, tuple)
-
-    def test_method_not_supported(self):
-        """ method_not_supported  test """
-        bad_errror = method_not_supported("error")
-
-        self.assertIsInstance(bad_errror, tuple)
+    assert isinstance(response, tuple)